@@ -17,15 +17,17 @@
 import json
 import os
 import sys
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Union
 
 from .validate_email import validate_email, _Resolver
-from .deliverability import caching_resolver
 from .exceptions import EmailNotValidError
 
 
-def main(dns_resolver: Optional[_Resolver] = None) -> None:
-    # The dns_resolver argument is for tests.
+def _main_core(argv: List[str], stdin: TextIO, dns_resolver: Optional[_Resolver] = None) -> Iterator[Union[Dict[str, Any], str]]:
+    # Validate the email addresses given in argv or stdin and yield
+    # the information about a valid address as a dict or the validation
+    # error as a string. main() prints these. The dns_resolver argument
+    # is for tests.
 
     # Set options from environment variables.
     options: Dict[str, Any] = {}
@@ -38,23 +40,35 @@ def main(dns_resolver: Optional[_Resolver] = None) -> None:
         if varname in os.environ:
             options[varname.lower()] = float(os.environ[varname])
 
-    if len(sys.argv) == 1:
+    if len(argv) == 1:
         # Validate the email addresses passed line-by-line on STDIN.
+        # One caching resolver is shared by all of the addresses.
+        # Lazy load `deliverability` as it is slow to import (due to dns.resolver)
+        from .deliverability import caching_resolver
         dns_resolver = dns_resolver or caching_resolver()
-        for line in sys.stdin:
+        for line in stdin:
             email = line.strip()
             try:
                 validate_email(email, dns_resolver=dns_resolver, **options)
             except EmailNotValidError as e:
-                print(f"{email} {e}")
+                yield f"{email} {e}"
     else:
         # Validate the email address passed on the command line.
-        email = sys.argv[1]
+        email = argv[1]
         try:
             result = validate_email(email, dns_resolver=dns_resolver, **options)
-            print(json.dumps(result.as_dict(), indent=2, sort_keys=True, ensure_ascii=False))
+            yield result.as_dict()
         except EmailNotValidError as e:
-            print(e)
+            yield str(e)
+
+
+def main(dns_resolver: Optional[_Resolver] = None) -> None:
+    # The dns_resolver argument is for tests.
+    for result in _main_core(sys.argv, sys.stdin, dns_resolver=dns_resolver):
+        if isinstance(result, dict):
+            print(json.dumps(result, indent=2, sort_keys=True, ensure_ascii=False))
+        else:
+            print(result)
 
 
 if __name__ == "__main__":
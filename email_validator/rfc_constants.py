@@ -5,27 +5,54 @@ import re
 # Based on RFC 5322 3.2.3, these characters are permitted in email
 # addresses (not taking into account internationalization) separated by dots:
 ATEXT = r'a-zA-Z0-9_!#\$%&\'\*\+\-/=\?\^`\{\|\}~'
-ATEXT_RE = re.compile('[.' + ATEXT + ']')  # ATEXT plus dots
+NOT_ATEXT_RE = re.compile('[^.' + ATEXT + ']')  # finds characters other than ATEXT and dots in one pass
 DOT_ATOM_TEXT = re.compile('[' + ATEXT + ']+(?:\\.[' + ATEXT + r']+)*\Z')
 
+# RFC 5322 Appendix A.1.2 permits unquoted display names made of the same
+# characters plus spaces, but not periods. This finds the other characters.
+NOT_DISPLAY_NAME_ATEXT = re.compile('[^ ' + ATEXT + ']')
+
 # RFC 6531 3.3 extends the allowed characters in internationalized
 # addresses to also include three specific ranges of UTF8 defined in
 # RFC 3629 section 4, which appear to be the Unicode code points from
 # U+0080 to U+10FFFF.
 ATEXT_INTL = ATEXT + "\u0080-\U0010FFFF"
-ATEXT_INTL_DOT_RE = re.compile('[.' + ATEXT_INTL + ']')  # ATEXT_INTL plus dots
-DOT_ATOM_TEXT_INTL = re.compile('[' + ATEXT_INTL + ']+(?:\\.[' + ATEXT_INTL + r']+)*\Z')
+
+
+# Python's regular expression compiler builds character classes one
+# character at a time, so a class containing the range above takes
+# milliseconds to compile. The internationalized classes are instead
+# written as the negation of the ASCII characters that they don't
+# permit, which is equivalent and quick to compile.
+def ascii_chars_not_in(char_class: str) -> str:
+    # Return a character class body matching the ASCII characters that
+    # the character class body char_class doesn't match.
+    char_class_re = re.compile("[" + char_class + "]")
+    return "".join(f"\\x{i:02x}" for i in range(128) if not char_class_re.match(chr(i)))
+
+
+NOT_ATEXT_ASCII = ascii_chars_not_in(ATEXT)
+NOT_ATEXT_DOT_ASCII = ascii_chars_not_in('.' + ATEXT)
+NOT_ATEXT_INTL_DOT_RE = re.compile('[' + NOT_ATEXT_DOT_ASCII + ']')  # finds invalid characters in one pass
+DOT_ATOM_TEXT_INTL = re.compile('[^' + NOT_ATEXT_ASCII + ']+(?:\\.[^' + NOT_ATEXT_ASCII + r']+)*\Z')
 
 # The domain part of the email address, after IDNA (ASCII) encoding,
 # must also satisfy the requirements of RFC 952/RFC 1123 2.1 which
 # restrict the allowed characters of hostnames further.
-ATEXT_HOSTNAME_INTL = re.compile(r"[a-zA-Z0-9\-\." + "\u0080-\U0010FFFF" + "]")
+NOT_ATEXT_HOSTNAME_ASCII = ascii_chars_not_in(r"a-zA-Z0-9\-\.")
+NOT_ATEXT_HOSTNAME_INTL = re.compile("[" + NOT_ATEXT_HOSTNAME_ASCII + "]")  # finds invalid characters in one pass
 HOSTNAME_LABEL = r'(?:(?:[a-zA-Z0-9][a-zA-Z0-9\-]*)?[a-zA-Z0-9])'
 DOT_ATOM_TEXT_HOSTNAME = re.compile(HOSTNAME_LABEL + r'(?:\.' + HOSTNAME_LABEL + r')*\Z')
 DOMAIN_NAME_REGEX = re.compile(r"[A-Za-z]\Z")  # all TLDs currently end with a letter
 
+# RFC 5890's reserved LDH labels ("R-LDH labels") have hyphens in the third and
+# fourth positions. The only ones in use are Punycode labels, which start with "xn".
+# This matches any other R-LDH label in a domain name.
+R_LDH_LABEL = re.compile(r"(?:\A|\.)(?!xn)[^.]{2}--", re.I)
+
 # Domain literal (RFC 5322 3.4.1)
-DOMAIN_LITERAL_CHARS = re.compile(r"[\u0021-\u00FA\u005E-\u007E]")
+NOT_DOMAIN_LITERAL_CHARS = re.compile(r"[^\u0021-\u00FA\u005E-\u007E]")
+DOMAIN_LITERAL_IPV4 = re.compile(r"^[0-9\.]+$")  # untagged, so possibly an IPv4 address
 
 # Quoted-string local part (RFC 5321 4.1.2, internationalized by RFC 6531 3.3)
 # The permitted characters in a quoted string are the characters in the range
@@ -33,7 +60,12 @@ DOMAIN_LITERAL_CHARS = re.compile(r"[\u0021-\u00FA\u005E-\u007E]")
 # by a backslash. When internationalized, UTF-8 strings are also permitted except
 # the ASCII characters that are not previously permitted (see above).
 # QUOTED_LOCAL_PART_ADDR = re.compile(r"^\"((?:[\u0020-\u0021\u0023-\u005B\u005D-\u007E]|\\[\u0020-\u007E])*)\"@(.*)")
-QTEXT_INTL = re.compile(r"[\u0020-\u007E\u0080-\U0010FFFF]")
+# (The permitted characters are U+0020 to U+007E and U+0080 to U+10FFFF, so
+# this finds the characters that are not permitted in one pass.)
+NOT_QTEXT_INTL = re.compile(r"[\u0000-\u001F\u007F]")
+QUOTED_STRING_SPECIALS = re.compile(r'(["\\])')  # must be backslash-escaped in a quoted string
+QUOTED_STRING_BODY = re.compile(r'(?:[^"\\]|\\.)*', re.DOTALL)  # up to the first unescaped quote
+BACKSLASH_ESCAPE = re.compile(r'\\(.)', re.DOTALL)  # escapes are parsed liberally, see unquote_quoted_string
 
 # Length constants
 # RFC 3696 + errata 1003 + errata 1690 (https://www.rfc-editor.org/errata_search.php?rfc=3696&eid=1690)
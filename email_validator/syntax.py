@@ -1,14 +1,109 @@
 from .exceptions import EmailSyntaxError
 from .types import ValidatedEmail
 from .rfc_constants import EMAIL_MAX_LENGTH, LOCAL_PART_MAX_LENGTH, DOMAIN_MAX_LENGTH, \
-    DOT_ATOM_TEXT, DOT_ATOM_TEXT_INTL, ATEXT_RE, ATEXT_INTL_DOT_RE, ATEXT_HOSTNAME_INTL, QTEXT_INTL, \
-    DNS_LABEL_LENGTH_LIMIT, DOT_ATOM_TEXT_HOSTNAME, DOMAIN_NAME_REGEX, DOMAIN_LITERAL_CHARS
+    DOT_ATOM_TEXT, DOT_ATOM_TEXT_INTL, NOT_ATEXT_RE, NOT_ATEXT_INTL_DOT_RE, NOT_ATEXT_HOSTNAME_INTL, NOT_QTEXT_INTL, \
+    DNS_LABEL_LENGTH_LIMIT, DOT_ATOM_TEXT_HOSTNAME, DOMAIN_NAME_REGEX, NOT_DOMAIN_LITERAL_CHARS, \
+    NOT_DISPLAY_NAME_ATEXT, DOMAIN_LITERAL_IPV4, QUOTED_STRING_SPECIALS, QUOTED_STRING_BODY, BACKSLASH_ESCAPE, \
+    R_LDH_LABEL
 
+import functools
 import re
 import unicodedata
-import idna  # implements IDNA 2008; Python's codec is only IDNA 2003
 import ipaddress
-from typing import Optional, Tuple, TypedDict, Union
+import socket
+from typing import FrozenSet, Iterable, Optional, Sequence, Tuple, TypedDict, Union
+
+
+def split_string_at_unquoted_special(text: str, specials: Tuple[str, ...]) -> Tuple[str, str]:
+    # Split the string at the first character in specials (an @-sign
+    # or left angle bracket) that does not occur within quotes and
+    # is not followed by a Unicode combining character.
+    # If no special character is found, raise an error.
+    inside_quote = False
+    escaped = False
+    left_part = ""
+    text_is_ascii = text.isascii()
+    for i, c in enumerate(text):
+        # < plus U+0338 (Combining Long Solidus Overlay) normalizes to
+        # ≮ U+226E (Not Less-Than), and  it would be confusing to treat
+        # the < as the start of "<email>" syntax in that case. Likewise,
+        # if anything combines with an @ or ", we should probably not
+        # treat it as a special character. ASCII characters never combine
+        # with each other, so skip normalizing each remainder of an ASCII
+        # string.
+        if not text_is_ascii and unicodedata.normalize("NFC", text[i:])[0] != c:
+            left_part += c
+
+        elif inside_quote:
+            left_part += c
+            if c == '\\' and not escaped:
+                escaped = True
+            elif c == '"' and not escaped:
+                # The only way to exit the quote is an unescaped quote.
+                inside_quote = False
+                escaped = False
+            else:
+                escaped = False
+        elif c == '"':
+            left_part += c
+            inside_quote = True
+        elif c in specials:
+            # When unquoted, stop before a special character.
+            break
+        else:
+            left_part += c
+
+    # No special symbol found. The special symbols always
+    # include an at-sign, so this always indicates a missing
+    # at-sign. The other symbol is optional.
+    if len(left_part) == len(text):
+        # The full-width at-sign might occur in CJK contexts.
+        # We can't accept it because we only accept addresess
+        # that are actually valid. But if this is common we
+        # may want to consider accepting and normalizing full-
+        # width characters for the other special symbols (and
+        # full-width dot is already accepted in internationalized
+        # domains) with a new option.
+        # See https://news.ycombinator.com/item?id=42235268.
+        if "＠" in text:
+            raise EmailSyntaxError("The email address has the \"full-width\" at-sign (@) character instead of a regular at-sign.")
+
+        # Check another near-homoglyph for good measure because
+        # homoglyphs in place of required characters could be
+        # very confusing. We may want to consider checking for
+        # homoglyphs anywhere we look for a special symbol.
+        if "﹫" in text:
+            raise EmailSyntaxError('The email address has the "small commercial at" character instead of a regular at-sign.')
+
+        raise EmailSyntaxError("An email address must have an @-sign.")
+
+    # The right part is whatever is left.
+    right_part = text[len(left_part):]
+
+    return left_part, right_part
+
+
+def unquote_quoted_string(text: str) -> Tuple[str, bool]:
+    # Remove surrounding quotes and unescape escaped backslashes
+    # and quotes. Escapes are parsed liberally. I think only
+    # backslashes and quotes can be escaped but we'll allow anything
+    # to be.
+    if not text.startswith('"'):
+        return text, False
+
+    # Find the quoted string up to the first unescaped quote. The
+    # match stops early only at the closing quote or at a backslash
+    # that ends the string. An unclosed quoted string, or a final
+    # backslash with nothing to escape, is taken as is.
+    m = QUOTED_STRING_BODY.match(text, 1)
+    assert m is not None  # the pattern matches the empty string, so it always matches
+    value = BACKSLASH_ESCAPE.sub(r"\1", m.group())
+    rest = text[m.end():]
+    if rest.startswith('"') and len(rest) > 1:
+        raise EmailSyntaxError("Extra character(s) found after close quote: "
+                               + ", ".join(safe_character_display(c) for c in rest[1:]))
+
+    return value, True
 
 
 def split_email(email: str) -> Tuple[Optional[str], str, str, bool]:
@@ -47,99 +142,14 @@ def split_email(email: str) -> Tuple[Optional[str], str, str, bool]:
     # We assume the input string is already stripped of leading and
     # trailing CFWS.
 
-    def split_string_at_unquoted_special(text: str, specials: Tuple[str, ...]) -> Tuple[str, str]:
-        # Split the string at the first character in specials (an @-sign
-        # or left angle bracket) that does not occur within quotes and
-        # is not followed by a Unicode combining character.
-        # If no special character is found, raise an error.
-        inside_quote = False
-        escaped = False
-        left_part = ""
-        for i, c in enumerate(text):
-            # < plus U+0338 (Combining Long Solidus Overlay) normalizes to
-            # ≮ U+226E (Not Less-Than), and  it would be confusing to treat
-            # the < as the start of "<email>" syntax in that case. Likewise,
-            # if anything combines with an @ or ", we should probably not
-            # treat it as a special character.
-            if unicodedata.normalize("NFC", text[i:])[0] != c:
-                left_part += c
-
-            elif inside_quote:
-                left_part += c
-                if c == '\\' and not escaped:
-                    escaped = True
-                elif c == '"' and not escaped:
-                    # The only way to exit the quote is an unescaped quote.
-                    inside_quote = False
-                    escaped = False
-                else:
-                    escaped = False
-            elif c == '"':
-                left_part += c
-                inside_quote = True
-            elif c in specials:
-                # When unquoted, stop before a special character.
-                break
-            else:
-                left_part += c
-
-        # No special symbol found. The special symbols always
-        # include an at-sign, so this always indicates a missing
-        # at-sign. The other symbol is optional.
-        if len(left_part) == len(text):
-            # The full-width at-sign might occur in CJK contexts.
-            # We can't accept it because we only accept addresess
-            # that are actually valid. But if this is common we
-            # may want to consider accepting and normalizing full-
-            # width characters for the other special symbols (and
-            # full-width dot is already accepted in internationalized
-            # domains) with a new option.
-            # See https://news.ycombinator.com/item?id=42235268.
-            if "＠" in text:
-                raise EmailSyntaxError("The email address has the \"full-width\" at-sign (@) character instead of a regular at-sign.")
-
-            # Check another near-homoglyph for good measure because
-            # homoglyphs in place of required characters could be
-            # very confusing. We may want to consider checking for
-            # homoglyphs anywhere we look for a special symbol.
-            if "﹫" in text:
-                raise EmailSyntaxError('The email address has the "small commercial at" character instead of a regular at-sign.')
-
-            raise EmailSyntaxError("An email address must have an @-sign.")
-
-        # The right part is whatever is left.
-        right_part = text[len(left_part):]
-
-        return left_part, right_part
-
-    def unquote_quoted_string(text: str) -> Tuple[str, bool]:
-        # Remove surrounding quotes and unescape escaped backslashes
-        # and quotes. Escapes are parsed liberally. I think only
-        # backslashes and quotes can be escaped but we'll allow anything
-        # to be.
-        quoted = False
-        escaped = False
-        value = ""
-        for i, c in enumerate(text):
-            if quoted:
-                if escaped:
-                    value += c
-                    escaped = False
-                elif c == '\\':
-                    escaped = True
-                elif c == '"':
-                    if i != len(text) - 1:
-                        raise EmailSyntaxError("Extra character(s) found after close quote: "
-                                               + ", ".join(safe_character_display(c) for c in text[i + 1:]))
-                    break
-                else:
-                    value += c
-            elif i == 0 and c == '"':
-                quoted = True
-            else:
-                value += c
-
-        return value, quoted
+    # Most addresses are ASCII and have no quotes or angle brackets. For
+    # them, the loop in split_string_at_unquoted_special would split at the
+    # first @-sign and unquote_quoted_string would return the local part
+    # unchanged, so do that directly.
+    if '"' not in email and '<' not in email and email.isascii():
+        local_part, at_sign, domain_part = email.partition("@")
+        if at_sign:
+            return None, local_part, domain_part, False
 
     # Split the string at the first unquoted @-sign or left angle bracket.
     left_part, right_part = split_string_at_unquoted_special(email, ("@", "<"))
@@ -158,13 +168,9 @@ def split_email(email: str) -> Tuple[Optional[str], str, str, bool]:
         # Check that only basic characters are present in a
         # non-quoted display name.
         if not display_name_quoted:
-            bad_chars = {
-                safe_character_display(c)
-                for c in display_name
-                if (not ATEXT_RE.match(c) and c != ' ') or c == '.'
-            }
+            bad_chars = NOT_DISPLAY_NAME_ATEXT.findall(display_name)
             if bad_chars:
-                raise EmailSyntaxError("The display name contains invalid characters when not quoted: " + ", ".join(sorted(bad_chars)) + ".")
+                raise EmailSyntaxError("The display name contains invalid characters when not quoted: " + safe_characters_display(bad_chars) + ".")
 
         # Check for other unsafe characters.
         check_unsafe_chars(display_name, allow_space=True)
@@ -222,6 +228,12 @@ def safe_character_display(c: str) -> str:
     return unicodedata.name(c, h)
 
 
+def safe_characters_display(chars: Iterable[str]) -> str:
+    # Return the distinct characters for an error message, made safely
+    # displayable, sorted, and separated by commas.
+    return ", ".join(sorted({safe_character_display(c) for c in chars}))
+
+
 class LocalPartValidationResult(TypedDict):
     local_part: str
     ascii_local_part: Optional[str]
@@ -278,22 +290,19 @@ def validate_email_local_part(local: str, allow_smtputf8: bool = True, allow_emp
     # The local part failed the basic dot-atom check. Try the extended character set
     # for internationalized addresses. It's the same pattern but with additional
     # characters permitted.
-    # RFC 6531 section 3.3.
+    # RFC 6531 section 3.3. (An ASCII local part that failed the check above
+    # fails this one too, so it is skipped for ASCII strings.)
     valid: Optional[str] = None
     requires_smtputf8 = False
-    if DOT_ATOM_TEXT_INTL.match(local):
+    if not local.isascii() and DOT_ATOM_TEXT_INTL.match(local):
         # But international characters in the local part may not be permitted.
         if not allow_smtputf8:
             # Check for invalid characters against the non-internationalized
             # permitted character set.
             # (RFC 5322 3.2.3)
-            bad_chars = {
-                safe_character_display(c)
-                for c in local
-                if not ATEXT_RE.match(c)
-            }
+            bad_chars = NOT_ATEXT_RE.findall(local)
             if bad_chars:
-                raise EmailSyntaxError("Internationalized characters before the @-sign are not supported: " + ", ".join(sorted(bad_chars)) + ".")
+                raise EmailSyntaxError("Internationalized characters before the @-sign are not supported: " + safe_characters_display(bad_chars) + ".")
 
             # Although the check above should always find something, fall back to this just in case.
             raise EmailSyntaxError("Internationalized characters before the @-sign are not supported.")
@@ -311,26 +320,19 @@ def validate_email_local_part(local: str, allow_smtputf8: bool = True, allow_emp
         # (RFC 5321 4.1.2. RFC 5322 lists additional permitted *obsolete*
         # characters which are *not* allowed here. RFC 6531 section 3.3
         # extends the range to UTF8 strings.)
-        bad_chars = {
-            safe_character_display(c)
-            for c in local
-            if not QTEXT_INTL.match(c)
-        }
+        bad_chars = NOT_QTEXT_INTL.findall(local)
         if bad_chars:
-            raise EmailSyntaxError("The email address contains invalid characters in quotes before the @-sign: " + ", ".join(sorted(bad_chars)) + ".")
+            raise EmailSyntaxError("The email address contains invalid characters in quotes before the @-sign: " + safe_characters_display(bad_chars) + ".")
 
-        # See if any characters are outside of the ASCII range.
-        bad_chars = {
-            safe_character_display(c)
-            for c in local
-            if not (32 <= ord(c) <= 126)
-        }
-        if bad_chars:
+        # See if any characters are outside of the ASCII range. (The
+        # ASCII control characters were rejected above.)
+        if not local.isascii():
             requires_smtputf8 = True
 
             # International characters in the local part may not be permitted.
             if not allow_smtputf8:
-                raise EmailSyntaxError("Internationalized characters before the @-sign are not supported: " + ", ".join(sorted(bad_chars)) + ".")
+                bad_chars = [c for c in local if not c.isascii()]
+                raise EmailSyntaxError("Internationalized characters before the @-sign are not supported: " + safe_characters_display(bad_chars) + ".")
 
         # It's valid.
         valid = "quoted"
@@ -340,7 +342,7 @@ def validate_email_local_part(local: str, allow_smtputf8: bool = True, allow_emp
     if valid:
         # Check that the local part is a valid, safe, and sensible Unicode string.
         # Some of this may be redundant with the range U+0080 to U+10FFFF that is checked
-        # by DOT_ATOM_TEXT_INTL and QTEXT_INTL. Other characters may be permitted by the
+        # by DOT_ATOM_TEXT_INTL and NOT_QTEXT_INTL. Other characters may be permitted by the
         # email specs, but they may not be valid, safe, or sensible Unicode strings.
         # See the function for rationale.
         check_unsafe_chars(local, allow_space=(valid == "quoted"))
@@ -358,7 +360,7 @@ def validate_email_local_part(local: str, allow_smtputf8: bool = True, allow_emp
         # escapes). Per RFC 5321 4.1.2, "all quoted forms MUST be treated as equivalent,
         # and the sending system SHOULD transmit the form that uses the minimum quoting possible."
         if valid == "quoted":
-            local = '"' + re.sub(r'(["\\])', r'\\\1', local) + '"'
+            local = '"' + QUOTED_STRING_SPECIALS.sub(r'\\\1', local) + '"'
 
         return {
             "local_part": local,
@@ -372,13 +374,9 @@ def validate_email_local_part(local: str, allow_smtputf8: bool = True, allow_emp
 
     # Check for invalid characters.
     # (RFC 5322 3.2.3, plus RFC 6531 3.3)
-    bad_chars = {
-        safe_character_display(c)
-        for c in local
-        if not ATEXT_INTL_DOT_RE.match(c)
-    }
+    bad_chars = NOT_ATEXT_INTL_DOT_RE.findall(local)
     if bad_chars:
-        raise EmailSyntaxError("The email address contains invalid characters before the @-sign: " + ", ".join(sorted(bad_chars)) + ".")
+        raise EmailSyntaxError("The email address contains invalid characters before the @-sign: " + safe_characters_display(bad_chars) + ".")
 
     # Check for dot errors imposted by the dot-atom rule.
     # (RFC 5322 3.2.3)
@@ -389,9 +387,23 @@ def validate_email_local_part(local: str, allow_smtputf8: bool = True, allow_emp
     raise EmailSyntaxError("The email address contains invalid characters before the @-sign.")
 
 
+# Among ASCII characters, only the control characters and the space are
+# not letters, numbers, punctuation, or symbols.
+UNSAFE_ASCII_CHARS = re.compile(r"[\x00-\x1f\x7f ]")
+UNSAFE_ASCII_CHARS_EXCEPT_SPACE = re.compile(r"[\x00-\x1f\x7f]")
+
+
 def check_unsafe_chars(s: str, allow_space: bool = False) -> None:
     # Check for unsafe characters or characters that would make the string
     # invalid or non-sensible Unicode.
+
+    # Most strings are ASCII, and for those a regular expression gives the
+    # same result as checking the category of each character below. If it
+    # finds something, fall through to get the error message.
+    if s.isascii():
+        if not (UNSAFE_ASCII_CHARS_EXCEPT_SPACE if allow_space else UNSAFE_ASCII_CHARS).search(s):
+            return
+
     bad_chars = set()
     for i, c in enumerate(s):
         category = unicodedata.category(c)
@@ -441,6 +453,37 @@ def check_unsafe_chars(s: str, allow_space: bool = False) -> None:
                                + ", ".join(safe_character_display(c) for c in sorted(bad_chars)) + ".")
 
 
+# The idna package is implemented in Python and is relatively slow, and
+# the same domain names tend to be seen repeatedly, so the results of
+# these functions are cached. Exceptions are not cached and are raised
+# to the caller each time. The idna package implements IDNA 2008 (Python's
+# codec is only IDNA 2003). It is imported only when it is needed because
+# it is slow to import and plain ASCII domains don't need it.
+
+@functools.lru_cache(maxsize=1024)
+def idna_uts46_remap(domain: str) -> str:
+    import idna
+    return idna.uts46_remap(domain, std3_rules=False, transitional=False)
+
+
+@functools.lru_cache(maxsize=1024)
+def idna_alabel(label: str) -> bytes:
+    import idna
+    return idna.alabel(label)
+
+
+@functools.lru_cache(maxsize=1024)
+def idna_decode(ascii_domain: str) -> str:
+    import idna
+    return idna.decode(ascii_domain.encode('ascii'))
+
+
+@functools.lru_cache(maxsize=1024)
+def idna_encode(domain: str) -> bytes:
+    import idna
+    return idna.encode(domain)
+
+
 def check_dot_atom(label: str, start_descr: str, end_descr: str, is_hostname: bool) -> None:
     # RFC 5322 3.2.3
     if label.endswith("."):
@@ -460,23 +503,30 @@ def check_dot_atom(label: str, start_descr: str, end_descr: str, is_hostname: bo
             raise EmailSyntaxError("An email address cannot have a period and a hyphen next to each other.")
 
 
+@functools.lru_cache(maxsize=32)
+def get_reserved_domain_names(special_use_domain_names: Tuple[str, ...], test_environment: bool) -> FrozenSet[str]:
+    # Return the special-use domain names that are rejected as a set.
+    # See the note near the definition of SPECIAL_USE_DOMAIN_NAMES.
+    return frozenset(
+        d for d in special_use_domain_names
+        if not (d == "test" and test_environment)
+    )
+
+
 class DomainNameValidationResult(TypedDict):
     ascii_domain: str
     domain: str
 
 
-def validate_email_domain_name(domain: str, test_environment: bool = False, globally_deliverable: bool = True) -> DomainNameValidationResult:
+def validate_email_domain_name(domain: str, test_environment: bool = False, globally_deliverable: bool = True,
+                               special_use_domain_names: Optional[Sequence[str]] = None) -> DomainNameValidationResult:
     """Validates the syntax of the domain part of an email address."""
 
     # Check for invalid characters.
     # (RFC 952 plus RFC 6531 section 3.3 for internationalized addresses)
-    bad_chars = {
-        safe_character_display(c)
-        for c in domain
-        if not ATEXT_HOSTNAME_INTL.match(c)
-    }
+    bad_chars = NOT_ATEXT_HOSTNAME_INTL.findall(domain)
     if bad_chars:
-        raise EmailSyntaxError("The part after the @-sign contains invalid characters: " + ", ".join(sorted(bad_chars)) + ".")
+        raise EmailSyntaxError("The part after the @-sign contains invalid characters: " + safe_characters_display(bad_chars) + ".")
 
     # Check for unsafe characters.
     # Some of this may be redundant with the range U+0080 to U+10FFFF that is checked
@@ -492,21 +542,27 @@ def validate_email_domain_name(domain: str, test_environment: bool = False, glob
     # U+1FEF which normalizes to a backtick, which is not an allowed hostname character.
     # Since several characters *are* normalized to a dot, this has to come before
     # checks related to dots, like check_dot_atom which comes next.
+    #
+    # Most domains are ASCII without Punycode labels. Having passed the character
+    # check above, UTS-46 normalization of such a domain only lowercases it, and
+    # the IDNA conversions at the end of this function return it unchanged, so
+    # the idna package is skipped for them.
     original_domain = domain
-    try:
-        domain = idna.uts46_remap(domain, std3_rules=False, transitional=False)
-    except idna.IDNAError as e:
-        raise EmailSyntaxError(f"The part after the @-sign contains invalid characters ({e}).") from e
+    is_plain_ascii_domain = domain.isascii() and "xn--" not in domain.lower()
+    if is_plain_ascii_domain:
+        domain = domain.lower()
+    else:
+        import idna
+        try:
+            domain = idna_uts46_remap(domain)
+        except idna.IDNAError as e:
+            raise EmailSyntaxError(f"The part after the @-sign contains invalid characters ({e}).") from e
 
     # Check for invalid characters after Unicode normalization which are not caught
     # by uts46_remap (see tests for examples).
-    bad_chars = {
-        safe_character_display(c)
-        for c in domain
-        if not ATEXT_HOSTNAME_INTL.match(c)
-    }
+    bad_chars = NOT_ATEXT_HOSTNAME_INTL.findall(domain)
     if bad_chars:
-        raise EmailSyntaxError("The part after the @-sign contains invalid characters after Unicode normalization: " + ", ".join(sorted(bad_chars)) + ".")
+        raise EmailSyntaxError("The part after the @-sign contains invalid characters after Unicode normalization: " + safe_characters_display(bad_chars) + ".")
 
     # The domain part is made up dot-separated "labels." Each label must
     # have at least one character and cannot start or end with dashes, which
@@ -519,9 +575,8 @@ def validate_email_domain_name(domain: str, test_environment: bool = False, glob
 
     # Check for RFC 5890's invalid R-LDH labels, which are labels that start
     # with two characters other than "xn" and two dashes.
-    for label in domain.split("."):
-        if re.match(r"(?!xn)..--", label, re.I):
-            raise EmailSyntaxError("An email address cannot have two letters followed by two dashes immediately after the @-sign or after a period, except Punycode.")
+    if R_LDH_LABEL.search(domain):
+        raise EmailSyntaxError("An email address cannot have two letters followed by two dashes immediately after the @-sign or after a period, except Punycode.")
 
     if DOT_ATOM_TEXT_HOSTNAME.match(domain):
         # This is a valid non-internationalized domain.
@@ -540,9 +595,10 @@ def validate_email_domain_name(domain: str, test_environment: bool = False, glob
         # doesn't give a nice error, so we call the underlying idna.alabel method
         # directly. idna.alabel checks label length and doesn't give great messages,
         # but we can't easily go to lower level methods.
+        import idna
         try:
             ascii_domain = ".".join(
-                idna.alabel(label).decode("ascii")
+                idna_alabel(label).decode("ascii")
                 for label in domain.split(".")
             )
         except idna.IDNAError as e:
@@ -596,14 +652,14 @@ def validate_email_domain_name(domain: str, test_environment: bool = False, glob
     # Some might fail DNS-based deliverability checks, but that
     # can be turned off, so we should fail them all sooner.
     # See the references in __init__.py.
-    from . import SPECIAL_USE_DOMAIN_NAMES
-    for d in SPECIAL_USE_DOMAIN_NAMES:
-        # See the note near the definition of SPECIAL_USE_DOMAIN_NAMES.
-        if d == "test" and test_environment:
-            continue
-
-        if ascii_domain == d or ascii_domain.endswith("." + d):
-            raise EmailSyntaxError("The part after the @-sign is a special-use or reserved name that cannot be used with email.")
+    # The domain is rejected if it or any of its parent domains is in the list.
+    if special_use_domain_names is None:
+        from . import SPECIAL_USE_DOMAIN_NAMES
+        special_use_domain_names = SPECIAL_USE_DOMAIN_NAMES
+    reserved_domain_names = get_reserved_domain_names(tuple(special_use_domain_names), test_environment)
+    labels = ascii_domain.split(".")
+    if any(".".join(labels[i:]) in reserved_domain_names for i in range(len(labels))):
+        raise EmailSyntaxError("The part after the @-sign is a special-use or reserved name that cannot be used with email.")
 
     # We may have been given an IDNA ASCII domain to begin with. Check
     # that the domain actually conforms to IDNA. It could look like IDNA
@@ -613,35 +669,36 @@ def validate_email_domain_name(domain: str, test_environment: bool = False, glob
     # This gives us the canonical internationalized form of the domain,
     # which we return to the caller as a part of the normalized email
     # address.
-    try:
-        domain_i18n = idna.decode(ascii_domain.encode('ascii'))
-    except idna.IDNAError as e:
-        raise EmailSyntaxError(f"The part after the @-sign is not valid IDNA ({e}).") from e
-
-    # Check that this normalized domain name has not somehow become
-    # an invalid domain name. All of the checks before this point
-    # using the idna package probably guarantee that we now have
-    # a valid international domain name in most respects. But it
-    # doesn't hurt to re-apply some tests to be sure. See the similar
-    # tests above.
-
-    # Check for invalid and unsafe characters. We have no test
-    # case for this.
-    bad_chars = {
-        safe_character_display(c)
-        for c in domain
-        if not ATEXT_HOSTNAME_INTL.match(c)
-    }
-    if bad_chars:
-        raise EmailSyntaxError("The part after the @-sign contains invalid characters: " + ", ".join(sorted(bad_chars)) + ".")
-    check_unsafe_chars(domain)
+    if is_plain_ascii_domain:
+        # See above. The conversion would give the same thing back.
+        domain_i18n = ascii_domain
+    else:
+        import idna
+        try:
+            domain_i18n = idna_decode(ascii_domain)
+        except idna.IDNAError as e:
+            raise EmailSyntaxError(f"The part after the @-sign is not valid IDNA ({e}).") from e
+
+        # Check that this normalized domain name has not somehow become
+        # an invalid domain name. All of the checks before this point
+        # using the idna package probably guarantee that we now have
+        # a valid international domain name in most respects. But it
+        # doesn't hurt to re-apply some tests to be sure. See the similar
+        # tests above.
+
+        # Check for invalid and unsafe characters. We have no test
+        # case for this.
+        bad_chars = NOT_ATEXT_HOSTNAME_INTL.findall(domain)
+        if bad_chars:
+            raise EmailSyntaxError("The part after the @-sign contains invalid characters: " + safe_characters_display(bad_chars) + ".")
+        check_unsafe_chars(domain)
 
-    # Check that it can be encoded back to IDNA ASCII. We have no test
-    # case for this.
-    try:
-        idna.encode(domain_i18n)
-    except idna.IDNAError as e:
-        raise EmailSyntaxError(f"The part after the @-sign became invalid after normalizing to international characters ({e}).") from e
+        # Check that it can be encoded back to IDNA ASCII. We have no test
+        # case for this.
+        try:
+            idna_encode(domain_i18n)
+        except idna.IDNAError as e:
+            raise EmailSyntaxError(f"The part after the @-sign became invalid after normalizing to international characters ({e}).") from e
 
     # Return the IDNA ASCII-encoded form of the domain, which is how it
     # would be transmitted on the wire (except when used with SMTPUTF8
@@ -687,7 +744,9 @@ def validate_email_length(addrinfo: ValidatedEmail) -> None:
 
     for addr, reason in addresses_to_check:
         addr_len = len(addr)
-        addr_utf8_len = len(addr.encode("utf8"))
+        # ASCII strings (which includes all addresses given as bytes) have
+        # the same length in UTF-8, so skip making an encoded copy.
+        addr_utf8_len = addr_len if addr.isascii() else len(addr.encode("utf8"))
         diff = addr_utf8_len - EMAIL_MAX_LENGTH
         if diff > 0:
             if reason is None and addr_len == addr_utf8_len:
@@ -723,6 +782,14 @@ class DomainLiteralValidationResult(TypedDict):
     domain: str
 
 
+def inet_pton(address_family: int, ip_string: str) -> Optional[bytes]:
+    # Return the packed form of an IP address, or None if it isn't valid.
+    try:
+        return socket.inet_pton(address_family, ip_string)
+    except (OSError, ValueError):
+        return None
+
+
 def validate_email_domain_literal(domain_literal: str) -> DomainLiteralValidationResult:
     # This is obscure domain-literal syntax. Parse it and return
     # a compressed/normalized address.
@@ -733,11 +800,22 @@ def validate_email_domain_literal(domain_literal: str) -> DomainLiteralValidatio
     # Try to parse the domain literal as an IPv4 address.
     # There is no tag for IPv4 addresses, so we can never
     # be sure if the user intends an IPv4 address.
-    if re.match(r"^[0-9\.]+$", domain_literal):
-        try:
-            addr = ipaddress.IPv4Address(domain_literal)
-        except ValueError as e:
-            raise EmailSyntaxError(f"The address in brackets after the @-sign is not valid: It is not an IPv4 address ({e}) or is missing an address literal tag.") from e
+    #
+    # socket.inet_pton parses addresses in C, which is much faster than
+    # the ipaddress module's string parsers, so it is tried first. The
+    # ipaddress module's own parsing is used when it fails in order to
+    # get its error message, and also when the IPv4 address isn't written
+    # in its canonical form, because inet_pton on some platforms accepts
+    # forms that the ipaddress module rejects.
+    if DOMAIN_LITERAL_IPV4.match(domain_literal):
+        packed = inet_pton(socket.AF_INET, domain_literal)
+        if packed is not None and socket.inet_ntop(socket.AF_INET, packed) == domain_literal:
+            addr = ipaddress.IPv4Address(packed)
+        else:
+            try:
+                addr = ipaddress.IPv4Address(domain_literal)
+            except ValueError as e:
+                raise EmailSyntaxError(f"The address in brackets after the @-sign is not valid: It is not an IPv4 address ({e}) or is missing an address literal tag.") from e
 
         # Return the IPv4Address object and the domain back unchanged.
         return {
@@ -747,10 +825,14 @@ def validate_email_domain_literal(domain_literal: str) -> DomainLiteralValidatio
 
     # If it begins with "IPv6:" it's an IPv6 address.
     if domain_literal.startswith("IPv6:"):
-        try:
-            addr = ipaddress.IPv6Address(domain_literal[5:])
-        except ValueError as e:
-            raise EmailSyntaxError(f"The IPv6 address in brackets after the @-sign is not valid ({e}).") from e
+        packed = inet_pton(socket.AF_INET6, domain_literal[5:])
+        if packed is not None:
+            addr = ipaddress.IPv6Address(packed)
+        else:
+            try:
+                addr = ipaddress.IPv6Address(domain_literal[5:])
+            except ValueError as e:
+                raise EmailSyntaxError(f"The IPv6 address in brackets after the @-sign is not valid ({e}).") from e
 
         # Return the IPv6Address object and construct a normalized
         # domain literal.
@@ -770,13 +852,9 @@ def validate_email_domain_literal(domain_literal: str) -> DomainLiteralValidatio
 
     # Check for permitted ASCII characters. This actually doesn't matter
     # since there will be an exception after anyway.
-    bad_chars = {
-        safe_character_display(c)
-        for c in domain_literal
-        if not DOMAIN_LITERAL_CHARS.match(c)
-    }
+    bad_chars = NOT_DOMAIN_LITERAL_CHARS.findall(domain_literal)
     if bad_chars:
-        raise EmailSyntaxError("The part after the @-sign contains invalid characters in brackets: " + ", ".join(sorted(bad_chars)) + ".")
+        raise EmailSyntaxError("The part after the @-sign contains invalid characters in brackets: " + safe_characters_display(bad_chars) + ".")
 
     # There are no other domain literal tags.
     # https://www.iana.org/assignments/address-literal-tags/address-literal-tags.xhtml
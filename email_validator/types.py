@@ -6,6 +6,12 @@ class ValidatedEmail:
     """The validate_email function returns objects of this type holding the normalized form of the email address
     and other information."""
 
+    """The attributes are stored in slots rather than in a __dict__, which makes instances
+    smaller and attribute access faster."""
+    __slots__ = ('original', 'normalized', 'local_part', 'domain', 'domain_address',
+                 'ascii_email', 'ascii_local_part', 'ascii_domain', 'smtputf8',
+                 'mx', 'mx_fallback_type', 'display_name')
+
     """The email address that was passed to validate_email. (If passed as bytes, this will be a string.)"""
     original: str
 
@@ -50,6 +56,12 @@ class ValidatedEmail:
     """The display name in the original input text, unquoted and unescaped, or None."""
     display_name: Optional[str]
 
+    """Attributes can be set by keyword arguments, as in the output of as_constructor. Attributes
+    that are not given are left unset."""
+    def __init__(self, **kwargs: Any) -> None:
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
     def __repr__(self) -> str:
         return f"<ValidatedEmail {self.normalized}>"
 
@@ -63,7 +75,7 @@ class ValidatedEmail:
 
     @property
     def email(self) -> str:
-        warnings.warn("ValidatedEmail.email is deprecated and will be removed, use ValidatedEmail.normalized instead", DeprecationWarning)
+        warnings.warn("ValidatedEmail.email is deprecated and will be removed, use ValidatedEmail.normalized instead", DeprecationWarning, stacklevel=2)
         return self.normalized
 
     """For backwards compatibility, some fields are also exposed through a dict-like interface. Note
@@ -88,22 +100,29 @@ class ValidatedEmail:
             return self.mx_fallback_type
         raise KeyError()
 
-    """Tests use this."""
+    """Tests use this. Since defining __eq__ removes the default __hash__, and instances can be
+    modified, instances are not hashable."""
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ValidatedEmail):
             return False
+        return self._comparison_key() == other._comparison_key()
+
+    """The values compared by __eq__, as a tuple so that they are compared in a single
+    operation. It is not cached because the attributes of this object can be changed."""
+    def _comparison_key(self) -> Tuple[Any, ...]:
+        mx = getattr(self, 'mx', None)
         return (
-            self.normalized == other.normalized
-            and self.local_part == other.local_part
-            and self.domain == other.domain
-            and getattr(self, 'ascii_email', None) == getattr(other, 'ascii_email', None)
-            and getattr(self, 'ascii_local_part', None) == getattr(other, 'ascii_local_part', None)
-            and getattr(self, 'ascii_domain', None) == getattr(other, 'ascii_domain', None)
-            and self.smtputf8 == other.smtputf8
-            and repr(sorted(self.mx) if getattr(self, 'mx', None) else None)
-            == repr(sorted(other.mx) if getattr(other, 'mx', None) else None)
-            and getattr(self, 'mx_fallback_type', None) == getattr(other, 'mx_fallback_type', None)
-            and getattr(self, 'display_name', None) == getattr(other, 'display_name', None)
+            self.normalized,
+            self.local_part,
+            self.domain,
+            getattr(self, 'ascii_email', None),
+            getattr(self, 'ascii_local_part', None),
+            getattr(self, 'ascii_domain', None),
+            self.smtputf8,
+            sorted(mx) if mx else None,
+            getattr(self, 'mx_fallback_type', None),
+            getattr(self, 'display_name', None),
+            getattr(self, 'domain_address', None),
         )
 
     """This helps producing the README."""
@@ -120,7 +139,11 @@ class ValidatedEmail:
 
     """Convenience method for accessing ValidatedEmail as a dict"""
     def as_dict(self) -> Dict[str, Any]:
-        d = self.__dict__
+        d = {
+            key: getattr(self, key)
+            for key in self.__slots__
+            if hasattr(self, key)
+        }
         if d.get('domain_address'):
             d['domain_address'] = repr(d['domain_address'])
         return d
@@ -1,7 +1,11 @@
-from typing import Optional, Union, TYPE_CHECKING
+from typing import Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING, cast
+import copy
+import functools
+import sys
+from types import ModuleType
 import unicodedata
 
-from .exceptions import EmailSyntaxError
+from .exceptions import EmailNotValidError, EmailSyntaxError
 from .types import ValidatedEmail
 from .syntax import split_email, validate_email_local_part, validate_email_domain_name, validate_email_domain_literal, validate_email_length
 from .rfc_constants import CASE_INSENSITIVE_MAILBOX_NAMES
@@ -13,6 +17,12 @@ else:
     _Resolver = object
 
 
+def get_package() -> ModuleType:
+    # Return this package's module, whose global attributes hold the
+    # default values of the keyword arguments.
+    return sys.modules[__package__]
+
+
 def validate_email(
     email: Union[str, bytes],
     /,  # prior arguments are positional-only
@@ -34,27 +44,30 @@ def validate_email(
     valid, raises an EmailNotValidError. This is the main function of the module.
     """
 
-    # Fill in default values of arguments.
-    from . import ALLOW_SMTPUTF8, ALLOW_EMPTY_LOCAL, ALLOW_QUOTED_LOCAL, ALLOW_DOMAIN_LITERAL, ALLOW_DISPLAY_NAME, \
-        GLOBALLY_DELIVERABLE, CHECK_DELIVERABILITY, TEST_ENVIRONMENT, DEFAULT_TIMEOUT
+    # Fill in default values of arguments from the package's global
+    # attributes. They are read through the package module object
+    # because a "from . import" statement runs the import machinery
+    # each time this function is called. The module object's attributes
+    # are untyped, so each one is cast to its type for the type checker.
+    package = get_package()
     if allow_smtputf8 is None:
-        allow_smtputf8 = ALLOW_SMTPUTF8
+        allow_smtputf8 = cast(bool, package.ALLOW_SMTPUTF8)
     if allow_empty_local is None:
-        allow_empty_local = ALLOW_EMPTY_LOCAL
+        allow_empty_local = cast(bool, package.ALLOW_EMPTY_LOCAL)
     if allow_quoted_local is None:
-        allow_quoted_local = ALLOW_QUOTED_LOCAL
+        allow_quoted_local = cast(bool, package.ALLOW_QUOTED_LOCAL)
     if allow_domain_literal is None:
-        allow_domain_literal = ALLOW_DOMAIN_LITERAL
+        allow_domain_literal = cast(bool, package.ALLOW_DOMAIN_LITERAL)
     if allow_display_name is None:
-        allow_display_name = ALLOW_DISPLAY_NAME
+        allow_display_name = cast(bool, package.ALLOW_DISPLAY_NAME)
     if check_deliverability is None:
-        check_deliverability = CHECK_DELIVERABILITY
+        check_deliverability = cast(bool, package.CHECK_DELIVERABILITY)
     if test_environment is None:
-        test_environment = TEST_ENVIRONMENT
+        test_environment = cast(bool, package.TEST_ENVIRONMENT)
     if globally_deliverable is None:
-        globally_deliverable = GLOBALLY_DELIVERABLE
+        globally_deliverable = cast(bool, package.GLOBALLY_DELIVERABLE)
     if timeout is None and dns_resolver is None:
-        timeout = DEFAULT_TIMEOUT
+        timeout = cast(int, package.DEFAULT_TIMEOUT)
 
     # Allow email to be a str or bytes instance. If bytes,
     # it must be ASCII because that's how the bytes work
@@ -65,6 +78,116 @@ def validate_email(
         except ValueError as e:
             raise EmailSyntaxError("The email address is not valid ASCII.") from e
 
+    # Check the syntax of the address. The result is cached, so copy it
+    # before it is returned to the caller, who may modify it, and before
+    # deliverability information is added to it. The special-use domain
+    # names are passed because library users can change the list.
+    ret = copy.copy(_validate_email_syntax(
+        email,
+        allow_smtputf8=allow_smtputf8,
+        allow_empty_local=allow_empty_local,
+        allow_quoted_local=allow_quoted_local,
+        allow_domain_literal=allow_domain_literal,
+        allow_display_name=allow_display_name,
+        test_environment=test_environment,
+        globally_deliverable=globally_deliverable,
+        special_use_domain_names=tuple(cast(List[str], package.SPECIAL_USE_DOMAIN_NAMES)),
+    ))
+
+    if check_deliverability and not test_environment:
+        # Validate the email address's deliverability using DNS
+        # and update the returned ValidatedEmail object with metadata.
+
+        if getattr(ret, "domain_address", None) is not None:
+            # The domain is a domain literal. There is nothing to
+            # check --- skip deliverability checks.
+            return ret
+
+        # Lazy load `deliverability` as it is slow to import (due to dns.resolver)
+        from .deliverability import validate_email_deliverability
+        deliverability_info = validate_email_deliverability(
+            ret.ascii_domain, ret.domain, timeout, dns_resolver
+        )
+        mx = deliverability_info.get("mx")
+        if mx is not None:
+            ret.mx = mx
+        ret.mx_fallback_type = deliverability_info.get("mx_fallback_type")
+
+    return ret
+
+
+def validate_emails(
+    emails: Iterable[Union[str, bytes]],
+    /,  # prior arguments are positional-only
+    *,  # subsequent arguments are keyword-only
+    allow_smtputf8: Optional[bool] = None,
+    allow_empty_local: Optional[bool] = None,
+    allow_quoted_local: Optional[bool] = None,
+    allow_domain_literal: Optional[bool] = None,
+    allow_display_name: Optional[bool] = None,
+    check_deliverability: Optional[bool] = None,
+    test_environment: Optional[bool] = None,
+    globally_deliverable: Optional[bool] = None,
+    timeout: Optional[int] = None,
+    dns_resolver: Optional[_Resolver] = None
+) -> Iterator[Union[ValidatedEmail, EmailNotValidError]]:
+    """
+    Given an iterable of email addresses, and the same options as validate_email,
+    validates each address in turn and yields a ValidatedEmail instance for each
+    valid address or the EmailNotValidError for each invalid address. When checking
+    deliverability without a dns_resolver, one caching resolver is created and
+    shared by all of the addresses.
+    """
+
+    # Fill in default values of the arguments that determine whether
+    # a DNS resolver is needed.
+    package = get_package()
+    if check_deliverability is None:
+        check_deliverability = cast(bool, package.CHECK_DELIVERABILITY)
+    if test_environment is None:
+        test_environment = cast(bool, package.TEST_ENVIRONMENT)
+
+    if check_deliverability and not test_environment and dns_resolver is None:
+        # Lazy load `deliverability` as it is slow to import (due to dns.resolver)
+        from .deliverability import caching_resolver
+        dns_resolver = caching_resolver(timeout=timeout)
+        timeout = None
+
+    for email in emails:
+        try:
+            yield validate_email(
+                email,
+                allow_smtputf8=allow_smtputf8,
+                allow_empty_local=allow_empty_local,
+                allow_quoted_local=allow_quoted_local,
+                allow_domain_literal=allow_domain_literal,
+                allow_display_name=allow_display_name,
+                check_deliverability=check_deliverability,
+                test_environment=test_environment,
+                globally_deliverable=globally_deliverable,
+                timeout=timeout,
+                dns_resolver=dns_resolver
+            )
+        except EmailNotValidError as e:
+            yield e
+
+
+# The syntax checks are a function of only the address and the options,
+# so the results for recently seen addresses are kept. Invalid addresses
+# raise an exception, so only valid addresses are cached.
+@functools.lru_cache(maxsize=512)
+def _validate_email_syntax(
+    email: str,
+    *,
+    allow_smtputf8: bool,
+    allow_empty_local: bool,
+    allow_quoted_local: bool,
+    allow_domain_literal: bool,
+    allow_display_name: bool,
+    test_environment: bool,
+    globally_deliverable: bool,
+    special_use_domain_names: Tuple[str, ...],
+) -> ValidatedEmail:
     # Split the address into the display name (or None), the local part
     # (before the @-sign), and the domain part (after the @-sign).
     # Normally, there is only one @-sign. But the awkward "quoted string"
@@ -78,8 +201,10 @@ def validate_email(
         # display names (incorrectly called "quoted-string-part" there)
         # to be NFC normalized. Since these are not a part of what we
         # are really validating, we won't check that the input was NFC
-        # normalized, but we'll normalize in output.
-        display_name = unicodedata.normalize("NFC", display_name)
+        # normalized, but we'll normalize in output. (ASCII strings
+        # are always normalized.)
+        if not display_name.isascii():
+            display_name = unicodedata.normalize("NFC", display_name)
 
     # Collect return values in this instance.
     ret = ValidatedEmail()
@@ -112,7 +237,10 @@ def validate_email(
     # this library. (UTS #39 seems to require that the *input* be NKFC normalized
     # and has other requirements that are hard to check without additional Unicode
     # data, and I don't know whether the rules really apply in the wild.)
-    normalized_local_part = unicodedata.normalize("NFC", ret.local_part)
+    # (ASCII strings are always normalized.)
+    normalized_local_part = ret.local_part
+    if not normalized_local_part.isascii():
+        normalized_local_part = unicodedata.normalize("NFC", normalized_local_part)
     if normalized_local_part != ret.local_part:
         try:
             validate_email_local_part(normalized_local_part,
@@ -139,7 +267,6 @@ def validate_email(
         ret.local_part = ret.local_part.lower()
 
     # Validate the email address's domain part syntax and get a normalized form.
-    is_domain_literal = False
     if len(domain_part) == 0:
         raise EmailSyntaxError("There must be something after the @-sign.")
 
@@ -150,13 +277,13 @@ def validate_email(
             raise EmailSyntaxError("A bracketed IP address after the @-sign is not allowed here.")
         ret.domain = domain_literal_info["domain"]
         ret.ascii_domain = domain_literal_info["domain"]  # Domain literals are always ASCII.
-        ret.domain_address = domain_literal_info["domain_address"]
-        is_domain_literal = True  # Prevent deliverability checks.
+        ret.domain_address = domain_literal_info["domain_address"]  # Also prevents deliverability checks.
 
     else:
         # Check the syntax of the domain and get back a normalized
         # internationalized and ASCII form.
-        domain_name_info = validate_email_domain_name(domain_part, test_environment=test_environment, globally_deliverable=globally_deliverable)
+        domain_name_info = validate_email_domain_name(domain_part, test_environment=test_environment, globally_deliverable=globally_deliverable,
+                                                      special_use_domain_names=special_use_domain_names)
         ret.domain = domain_name_info["domain"]
         ret.ascii_domain = domain_name_info["ascii_domain"]
 
@@ -179,22 +306,4 @@ def validate_email(
     if display_name is not None and not allow_display_name:
         raise EmailSyntaxError("A display name and angle brackets around the email address are not permitted here.")
 
-    if check_deliverability and not test_environment:
-        # Validate the email address's deliverability using DNS
-        # and update the returned ValidatedEmail object with metadata.
-
-        if is_domain_literal:
-            # There is nothing to check --- skip deliverability checks.
-            return ret
-
-        # Lazy load `deliverability` as it is slow to import (due to dns.resolver)
-        from .deliverability import validate_email_deliverability
-        deliverability_info = validate_email_deliverability(
-            ret.ascii_domain, ret.domain, timeout, dns_resolver
-        )
-        mx = deliverability_info.get("mx")
-        if mx is not None:
-            ret.mx = mx
-        ret.mx_fallback_type = deliverability_info.get("mx_fallback_type")
-
     return ret
@@ -0,0 +1,56 @@
+# This script rebuilds pyisemail-tests.json, the pyIsEmail
+# (https://github.com/michaelherold/pyIsEmail) test suite
+# used by test_syntax.py, from pyIsEmail's test data:
+#
+# $ wget https://raw.githubusercontent.com/michaelherold/pyIsEmail/master/tests/data/tests.xml
+# $ python tests/pyisemail_tests.py tests.xml
+
+from typing import List
+import json
+import os.path
+import sys
+import xml.etree.ElementTree as ET
+
+DATA_PATH = os.path.dirname(__file__) + "/pyisemail-tests.json"
+
+# Test cases that are left out because email_validator
+# disagrees with pyIsEmail's diagnosis.
+EXCLUDED_TESTS = {
+    # We reject domains without a dot, knowing they are not deliverable.
+    'test@io',
+
+    # We think an empty quoted string should be invalid.
+    '""@iana.org',
+}
+
+
+def fixup_char(c: str) -> str:
+    # The test data represents control characters with
+    # the Unicode Control Pictures block.
+    if ord(c) >= 0x2400 and ord(c) <= 0x2432:
+        c = chr(ord(c) - 0x2400)
+    return c
+
+
+def load_xml(path: str) -> List[List[str]]:
+    tests = []
+    for test in ET.parse(path).getroot().iter("test"):
+        # Trailing whitespace is significant, so the address is not stripped.
+        email = "".join(fixup_char(c) for c in test.findtext("address", ""))
+        diagnosis = test.findtext("diagnosis", "").strip()
+        if email == "" or email in EXCLUDED_TESTS:
+            continue
+        tests.append([email, diagnosis])
+    return tests
+
+
+def save(tests: List[List[str]]) -> None:
+    # Write one test case per line so that changes are easy to review.
+    with open(DATA_PATH, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        f.write(",\n".join(json.dumps(test, ensure_ascii=False) for test in tests))
+        f.write("\n]\n")
+
+
+if __name__ == "__main__":
+    save(load_xml(sys.argv[1]))
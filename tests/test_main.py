@@ -1,8 +1,11 @@
+from typing import List, Union
+
 import pytest
 
-from email_validator import validate_email, EmailSyntaxError
+from email_validator import validate_email, validate_emails, ValidatedEmail, EmailSyntaxError
 # Let's test main but rename it to be clear
-from email_validator.__main__ import main as validator_command_line_tool
+from email_validator.__main__ import main as validator_command_line_tool, \
+                                     _main_core as validator_command_line_core
 
 from mocked_dns_response import MockedDnsResponseData, MockedDnsResponseDataCleanup  # noqa: F401
 
@@ -11,20 +14,18 @@ RESOLVER = MockedDnsResponseData.create_resolver()
 
 def test_dict_accessor() -> None:
     input_email = "testaddr@example.tld"
-    valid_email = validate_email(input_email, check_deliverability=False)
-    assert isinstance(valid_email.as_dict(), dict)
-    assert valid_email.as_dict()["original"] == input_email
+    valid_email = validate_email(input_email, check_deliverability=False).as_dict()
+    assert isinstance(valid_email, dict)
+    assert valid_email["original"] == input_email
 
 
-def test_main_single_good_input(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
-    import json
+def test_main_single_good_input() -> None:
+    import io
     test_email = "google@google.com"
-    monkeypatch.setattr('sys.argv', ['email_validator', test_email])
-    validator_command_line_tool(dns_resolver=RESOLVER)
-    stdout, _ = capsys.readouterr()
-    output = json.loads(str(stdout))
-    assert isinstance(output, dict)
-    assert validate_email(test_email, dns_resolver=RESOLVER).original == output["original"]
+    output = list(validator_command_line_core(['email_validator', test_email], io.StringIO(), dns_resolver=RESOLVER))
+    assert len(output) == 1
+    assert isinstance(output[0], dict)
+    assert validate_email(test_email, dns_resolver=RESOLVER).original == output[0]["original"]
 
 
 def test_main_single_bad_input(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
@@ -51,17 +52,31 @@ def test_main_multi_input(monkeypatch: pytest.MonkeyPatch, capsys: pytest.Captur
 
 def test_bytes_input() -> None:
     input_email = b"testaddr@example.tld"
-    valid_email = validate_email(input_email, check_deliverability=False)
-    assert isinstance(valid_email.as_dict(), dict)
-    assert valid_email.as_dict()["normalized"] == input_email.decode("utf8")
+    valid_email = validate_email(input_email, check_deliverability=False).as_dict()
+    assert isinstance(valid_email, dict)
+    assert valid_email["normalized"] == input_email.decode("utf8")
 
     input_email = "testaddr中example.tld".encode("utf32")
     with pytest.raises(EmailSyntaxError):
         validate_email(input_email, check_deliverability=False)
 
 
+def test_validate_emails() -> None:
+    test_cases: List[Union[str, bytes]] = ["google1@google.com", "test@.com", b"google2@google.com"]
+    results = list(validate_emails(test_cases, dns_resolver=RESOLVER))
+    assert len(results) == 3
+    assert isinstance(results[0], ValidatedEmail)
+    assert results[0].normalized == "google1@google.com"
+    assert results[0].mx is not None
+    assert isinstance(results[1], EmailSyntaxError)
+    assert str(results[1]) == "An email address cannot have a period immediately after the @-sign."
+    assert isinstance(results[2], ValidatedEmail)
+    assert results[2].normalized == "google2@google.com"
+
+
 def test_deprecation() -> None:
     input_email = b"testaddr@example.tld"
     valid_email = validate_email(input_email, check_deliverability=False)
+    # The old `email` attribute still gives the normalized form.
     with pytest.deprecated_call():
-        assert valid_email.email is not None
+        assert valid_email.email == valid_email.normalized